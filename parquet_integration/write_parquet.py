@@ -1,42 +1,184 @@
 from typing import Tuple
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
 
 PYARROW_PATH = "fixtures/pyarrow3"
 
-
-def case_basic_nullable() -> Tuple[dict, pa.Schema, str]:
-    int64 = [0, 1, None, 3, None, 5, 6, 7, None, 9]
-    float64 = [0.0, 1.0, None, 3.0, None, 5.0, 6.0, 7.0, None, 9.0]
-    string = ["Hello", None, "aa", "", None, "abc", None, None, "def", "aaa"]
-    boolean = [True, None, False, False, None, True, None, None, True, True]
-    string_large = [
-        "ABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCD😃🌚🕳👊"
-    ] * 10
-    emoji = ["😃"] * 10
-    decimal = [Decimal(e) if e is not None else None for e in int64]
-
-    fields = [
+# generation is deterministic for a given generator version, so existing
+# files are up to date and are skipped on incremental runs. Bump the
+# version whenever a change to this script alters the emitted bytes: a
+# mismatching (or missing) stamp forces a full rewrite, so trees holding
+# fixtures from an older generator cannot keep them silently.
+GENERATOR_VERSION = "1"
+_STAMP_PATH = os.path.join(PYARROW_PATH, ".generator-version")
+
+
+def _stale():
+    try:
+        with open(_STAMP_PATH) as stamp:
+            return stamp.read().strip() != GENERATOR_VERSION
+    except OSError:
+        return True
+
+
+FORCE = (
+    bool(os.environ.get("PARQUET_FIXTURES_FORCE"))
+    or "--force" in sys.argv
+    or _stale()
+)
+
+# jemalloc recycles the repeated 8-16 MiB bench buffers O(1) from its
+# thread cache instead of walking the system allocator's freelists; not
+# every pyarrow build ships it, so fall back to the default pool
+try:
+    pa.set_memory_pool(pa.jemalloc_memory_pool())
+except NotImplementedError:
+    pass
+
+# pyarrow type and schema objects are immutable: build them once at import
+# instead of on every case invocation
+_TS_MS = pa.timestamp("ms")
+_TS_US = pa.timestamp("us")
+_TS_S = pa.timestamp("s")
+_TS_S_UTC = pa.timestamp("s", "UTC")
+_DECIMAL_9 = pa.decimal128(9, 0)
+_DECIMAL_18 = pa.decimal128(18, 0)
+_DECIMAL_26 = pa.decimal128(26, 0)
+
+_SCHEMA_BASIC_NULLABLE = pa.schema(
+    [
         pa.field("int64", pa.int64()),
         pa.field("float64", pa.float64()),
         pa.field("string", pa.utf8()),
         pa.field("bool", pa.bool_()),
-        pa.field("date", pa.timestamp("ms")),
+        pa.field("date", _TS_MS),
         pa.field("uint32", pa.uint32()),
         pa.field("string_large", pa.utf8()),
         # decimal testing
-        pa.field("decimal_9", pa.decimal128(9, 0)),
-        pa.field("decimal_18", pa.decimal128(18, 0)),
-        pa.field("decimal_26", pa.decimal128(26, 0)),
-        pa.field("timestamp_us", pa.timestamp("us")),
-        pa.field("timestamp_s", pa.timestamp("s")),
+        pa.field("decimal_9", _DECIMAL_9),
+        pa.field("decimal_18", _DECIMAL_18),
+        pa.field("decimal_26", _DECIMAL_26),
+        pa.field("timestamp_us", _TS_US),
+        pa.field("timestamp_s", _TS_S),
         pa.field("emoji", pa.utf8()),
-        pa.field("timestamp_s_utc", pa.timestamp("s", "UTC")),
+        pa.field("timestamp_s_utc", _TS_S_UTC),
     ]
-    schema = pa.schema(fields)
+)
+
+_SCHEMA_BASIC_REQUIRED = pa.schema(
+    [
+        pa.field("int64", pa.int64(), nullable=False),
+        pa.field("float64", pa.float64(), nullable=False),
+        pa.field("string", pa.utf8(), nullable=False),
+        pa.field("bool", pa.bool_(), nullable=False),
+        pa.field("date", _TS_MS, nullable=False),
+        pa.field("uint32", pa.uint32(), nullable=False),
+        pa.field("decimal_9", _DECIMAL_9, nullable=False),
+        pa.field("decimal_18", _DECIMAL_18, nullable=False),
+        pa.field("decimal_26", _DECIMAL_26, nullable=False),
+    ]
+)
+
+_SCHEMA_NESTED = pa.schema(
+    [
+        pa.field("list_int64", pa.list_(pa.int64())),
+        pa.field("list_int64_required", pa.list_(pa.field("item", pa.int64(), False))),
+        pa.field(
+            "list_int64_required_required",
+            pa.list_(pa.field("item", pa.int64(), False)),
+            False,
+        ),
+        pa.field("list_int16", pa.list_(pa.int16())),
+        pa.field("list_bool", pa.list_(pa.bool_())),
+        pa.field("list_utf8", pa.list_(pa.utf8())),
+        pa.field("list_large_binary", pa.list_(pa.large_binary())),
+        pa.field("list_nested_i64", pa.list_(pa.list_(pa.int64()))),
+        pa.field("list_nested_inner_required_i64", pa.list_(pa.list_(pa.int64()))),
+        pa.field(
+            "list_nested_inner_required_required_i64", pa.list_(pa.list_(pa.int64()))
+        ),
+    ]
+)
+
+_STRUCT_FIELDS = [
+    pa.field("f1", pa.utf8()),
+    pa.field("f2", pa.bool_()),
+]
+
+_SCHEMA_STRUCT = pa.schema(
+    [
+        pa.field(
+            "struct",
+            pa.struct(_STRUCT_FIELDS),
+        ),
+        pa.field(
+            "struct_struct",
+            pa.struct(
+                [
+                    pa.field("f1", pa.struct(_STRUCT_FIELDS)),
+                    pa.field("f2", pa.bool_()),
+                ]
+            ),
+        ),
+    ]
+)
+
+_SCHEMA_NESTED_EDGE = pa.schema(
+    [
+        pa.field("simple", pa.list_(pa.int64())),
+        pa.field("null", pa.list_(pa.field("item", pa.int64(), True))),
+    ]
+)
+
+
+def _repeat_utf8(value: str, n: int) -> pa.Array:
+    # encode the string once and repeat it via a one-entry dictionary;
+    # avoids n UTF-8 validations of the same bytes
+    indices = pa.array(np.zeros(n, dtype=np.int32))
+    dictionary = pa.array([value], type=pa.utf8())
+    return pa.DictionaryArray.from_arrays(indices, dictionary).cast(pa.utf8())
+
+
+def case_basic_nullable() -> Tuple[dict, pa.Schema, str]:
+    # numeric columns as NumPy arrays + mask so that pyarrow hits its
+    # zero-copy buffer path instead of iterating Python objects
+    int64_values = np.array([0, 1, 0, 3, 0, 5, 6, 7, 0, 9], dtype=np.int64)
+    int64_mask = np.array(
+        [False, False, True, False, True, False, False, False, True, False]
+    )
+    float64_values = np.array(
+        [0.0, 1.0, 0.0, 3.0, 0.0, 5.0, 6.0, 7.0, 0.0, 9.0], dtype=np.float64
+    )
+    int64 = pa.array(int64_values, mask=int64_mask, type=pa.int64())
+    float64 = pa.array(float64_values, mask=int64_mask, type=pa.float64())
+    string = ["Hello", None, "aa", "", None, "abc", None, None, "def", "aaa"]
+    # [True, None, False, False, None, True, None, None, True, True]
+    boolean = pa.array(
+        np.array([True, False, False, False, False, True, False, False, True, True]),
+        mask=np.array(
+            [False, True, False, False, True, False, True, True, False, False]
+        ),
+        type=pa.bool_(),
+    )
+    string_large = _repeat_utf8(
+        "ABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCDABCD😃🌚🕳👊", 10
+    )
+    emoji = _repeat_utf8("😃", 10)
+    # parse the Decimal objects once at the widest precision; the narrower
+    # fields are cheap casts of the same 128-bit values
+    decimal = pa.array(
+        [
+            None if mask else Decimal(int(value))
+            for value, mask in zip(int64_values, int64_mask)
+        ],
+        type=_DECIMAL_26,
+    )
 
     return (
         {
@@ -44,48 +186,41 @@ def case_basic_nullable() -> Tuple[dict, pa.Schema, str]:
             "float64": float64,
             "string": string,
             "bool": boolean,
-            "date": int64,
-            "uint32": int64,
+            # reuse the int64 buffers for all columns sharing its values
+            "date": int64.cast(_TS_MS),
+            "uint32": int64.cast(pa.uint32()),
             "string_large": string_large,
-            "decimal_9": decimal,
-            "decimal_18": decimal,
+            "decimal_9": decimal.cast(_DECIMAL_9),
+            "decimal_18": decimal.cast(_DECIMAL_18),
             "decimal_26": decimal,
-            "timestamp_us": int64,
-            "timestamp_s": int64,
+            "timestamp_us": int64.cast(_TS_US),
+            "timestamp_s": int64.cast(_TS_S),
             "emoji": emoji,
-            "timestamp_s_utc": int64,
+            "timestamp_s_utc": int64.cast(_TS_S_UTC),
         },
-        schema,
+        _SCHEMA_BASIC_NULLABLE,
         f"basic_nullable_10.parquet",
     )
 
 
 def case_basic_required() -> Tuple[dict, pa.Schema, str]:
-    int64 = [-256, -1, 0, 1, 2, 3, 4, 5, 6, 7]
-    uint32 = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
-    float64 = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
-    string = ["Hello", "bbb", "aa", "", "bbb", "abc", "bbb", "bbb", "def", "aaa"]
-    boolean = [True, True, False, False, False, True, True, True, True, True]
-    decimal = [Decimal(e) for e in int64]
-
-    fields = [
-        pa.field("int64", pa.int64(), nullable=False),
-        pa.field("float64", pa.float64(), nullable=False),
-        pa.field("string", pa.utf8(), nullable=False),
-        pa.field("bool", pa.bool_(), nullable=False),
-        pa.field(
-            "date",
-            pa.timestamp(
-                "ms",
-            ),
-            nullable=False,
+    int64_values = np.array([-256, -1, 0, 1, 2, 3, 4, 5, 6, 7], dtype=np.int64)
+    int64 = pa.array(int64_values, type=pa.int64())
+    uint32 = pa.array(
+        np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], dtype=np.uint32), type=pa.uint32()
+    )
+    float64 = pa.array(
+        np.array(
+            [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0], dtype=np.float64
         ),
-        pa.field("uint32", pa.uint32(), nullable=False),
-        pa.field("decimal_9", pa.decimal128(9, 0), nullable=False),
-        pa.field("decimal_18", pa.decimal128(18, 0), nullable=False),
-        pa.field("decimal_26", pa.decimal128(26, 0), nullable=False),
-    ]
-    schema = pa.schema(fields)
+        type=pa.float64(),
+    )
+    string = ["Hello", "bbb", "aa", "", "bbb", "abc", "bbb", "bbb", "def", "aaa"]
+    boolean = pa.array(
+        np.array([True, True, False, False, False, True, True, True, True, True]),
+        type=pa.bool_(),
+    )
+    decimal = pa.array([Decimal(int(e)) for e in int64_values], type=_DECIMAL_26)
 
     return (
         {
@@ -93,19 +228,26 @@ def case_basic_required() -> Tuple[dict, pa.Schema, str]:
             "float64": float64,
             "string": string,
             "bool": boolean,
-            "date": int64,
+            "date": int64.cast(_TS_MS),
             "uint32": uint32,
-            "decimal_9": decimal,
-            "decimal_18": decimal,
+            "decimal_9": decimal.cast(_DECIMAL_9),
+            "decimal_18": decimal.cast(_DECIMAL_18),
             "decimal_26": decimal,
         },
-        schema,
+        _SCHEMA_BASIC_REQUIRED,
         f"basic_required_10.parquet",
     )
 
 
 def case_nested() -> Tuple[dict, pa.Schema, str]:
-    items_nullable = [[0, 1], None, [2, None, 3], [4, 5, 6], [], [7, 8, 9], None, [10]]
+    # [[0, 1], None, [2, None, 3], [4, 5, 6], [], [7, 8, 9], None, [10]]
+    # built Arrow-natively from flat values + offsets, which bypasses
+    # pyarrow's recursive Python-list traversal; a null offset at slot i
+    # makes list i null (from_arrays has no mask parameter in pyarrow 6)
+    items_nullable = pa.ListArray.from_arrays(
+        pa.array([0, None, 2, 5, 8, 8, None, 11, 12], type=pa.int32()),
+        pa.array([0, 1, 2, None, 3, 4, 5, 6, 7, 8, 9, 10], pa.int64()),
+    )
     items_required = [[0, 1], None, [2, 0, 3], [4, 5, 6], [], [7, 8, 9], None, [10]]
     all_required = [[0, 1], [], [2, 0, 3], [4, 5, 6], [], [7, 8, 9], [], [10]]
     i16 = [[0, 1], None, [2, None, 3], [4, 5, 6], [], [7, 8, 9], None, [10]]
@@ -119,16 +261,17 @@ def case_nested() -> Tuple[dict, pa.Schema, str]:
         None,
         [True],
     ]
-    items_nested = [
-        [[0, 1]],
-        None,
-        [[2, None], [3]],
-        [[4, 5], [6]],
-        [],
-        [[7], None, [9]],
-        [[], [None], None],
-        [[10]],
-    ]
+    # [[[0, 1]], None, [[2, None], [3]], [[4, 5], [6]], [],
+    #  [[7], None, [9]], [[], [None], None], [[10]]]
+    # as two stacked offset layers over one flat values array
+    items_nested_inner = pa.ListArray.from_arrays(
+        pa.array([0, 2, 4, 5, 7, 8, None, 9, 10, 10, None, 11, 12], type=pa.int32()),
+        pa.array([0, 1, 2, None, 3, 4, 5, 6, 7, 9, None, 10], pa.int64()),
+    )
+    items_nested = pa.ListArray.from_arrays(
+        pa.array([0, None, 1, 3, 5, 5, 8, 11, 12], type=pa.int32()),
+        items_nested_inner,
+    )
     items_required_nested = [
         [[0, 1]],
         None,
@@ -159,25 +302,6 @@ def case_nested() -> Tuple[dict, pa.Schema, str]:
         None,
         [""],
     ]
-    fields = [
-        pa.field("list_int64", pa.list_(pa.int64())),
-        pa.field("list_int64_required", pa.list_(pa.field("item", pa.int64(), False))),
-        pa.field(
-            "list_int64_required_required",
-            pa.list_(pa.field("item", pa.int64(), False)),
-            False,
-        ),
-        pa.field("list_int16", pa.list_(pa.int16())),
-        pa.field("list_bool", pa.list_(pa.bool_())),
-        pa.field("list_utf8", pa.list_(pa.utf8())),
-        pa.field("list_large_binary", pa.list_(pa.large_binary())),
-        pa.field("list_nested_i64", pa.list_(pa.list_(pa.int64()))),
-        pa.field("list_nested_inner_required_i64", pa.list_(pa.list_(pa.int64()))),
-        pa.field(
-            "list_nested_inner_required_required_i64", pa.list_(pa.list_(pa.int64()))
-        ),
-    ]
-    schema = pa.schema(fields)
     return (
         {
             "list_int64": items_nullable,
@@ -191,7 +315,7 @@ def case_nested() -> Tuple[dict, pa.Schema, str]:
             "list_nested_inner_required_i64": items_required_nested,
             "list_nested_inner_required_required_i64": items_required_nested_2,
         },
-        schema,
+        _SCHEMA_NESTED,
         f"nested_nullable_10.parquet",
     )
 
@@ -199,31 +323,10 @@ def case_nested() -> Tuple[dict, pa.Schema, str]:
 def case_struct() -> Tuple[dict, pa.Schema, str]:
     string = ["Hello", None, "aa", "", None, "abc", None, None, "def", "aaa"]
     boolean = [True, None, False, False, None, True, None, None, True, True]
-    struct_fields = [
-        ("f1", pa.utf8()),
-        ("f2", pa.bool_()),
-    ]
-    schema = pa.schema(
-        [
-            pa.field(
-                "struct",
-                pa.struct(struct_fields),
-            ),
-            pa.field(
-                "struct_struct",
-                pa.struct(
-                    [
-                        ("f1", pa.struct(struct_fields)),
-                        ("f2", pa.bool_()),
-                    ]
-                ),
-            ),
-        ]
-    )
 
     struct = pa.StructArray.from_arrays(
         [pa.array(string), pa.array(boolean)],
-        fields=struct_fields,
+        fields=_STRUCT_FIELDS,
     )
     return (
         {
@@ -233,7 +336,7 @@ def case_struct() -> Tuple[dict, pa.Schema, str]:
                 names=["f1", "f2"],
             ),
         },
-        schema,
+        _SCHEMA_STRUCT,
         f"struct_nullable_10.parquet",
     )
 
@@ -241,93 +344,262 @@ def case_struct() -> Tuple[dict, pa.Schema, str]:
 def case_nested_edge():
     simple = [[0, 1]]
     null = [None]
-    fields = [
-        pa.field("simple", pa.list_(pa.int64())),
-        pa.field("null", pa.list_(pa.field("item", pa.int64(), True))),
-    ]
-    schema = pa.schema(fields)
     return (
         {
             "simple": simple,
             "null": null,
         },
-        schema,
+        _SCHEMA_NESTED_EDGE,
         f"nested_edge_nullable_10.parquet",
     )
 
 
-def write_pyarrow(
-    case,
+# variant directory per (page_version, use_dictionary, multiple_pages,
+# compression), built and created on first use only
+_base_paths = {}
+
+
+def _base_path(page_version, use_dictionary, multiple_pages, compression):
+    key = (page_version, use_dictionary, multiple_pages, compression)
+    base_path = _base_paths.get(key)
+    if base_path is None:
+        base_path = f"{PYARROW_PATH}/v{page_version}"
+        if use_dictionary:
+            base_path = f"{base_path}/dict"
+
+        if multiple_pages:
+            base_path = f"{base_path}/multi"
+
+        if compression:
+            base_path = f"{base_path}/{compression}"
+
+        os.makedirs(base_path, exist_ok=True)
+        _base_paths[key] = base_path
+    return base_path
+
+
+def _full_path(path, page_version, use_dictionary, multiple_pages, compression):
+    return os.path.join(
+        _base_path(page_version, use_dictionary, multiple_pages, compression), path
+    )
+
+
+def write_pyarrow_table(
+    table: pa.Table,
+    full_path: str,
     page_version: int,
     use_dictionary: bool,
     multiple_pages: bool,
     compression: str,
 ):
-    data, schema, path = case
-
-    base_path = f"{PYARROW_PATH}/v{page_version}"
-    if use_dictionary:
-        base_path = f"{base_path}/dict"
-
-    if multiple_pages:
-        base_path = f"{base_path}/multi"
-
-    if compression:
-        base_path = f"{base_path}/{compression}"
+    if not FORCE and os.path.exists(full_path):
+        return
 
     if multiple_pages:
         data_page_size = 2 ** 10  # i.e. a small number to ensure multiple pages
     else:
         data_page_size = 2 ** 40  # i.e. a large number to ensure a single page
 
-    t = pa.table(data, schema=schema)
-    os.makedirs(base_path, exist_ok=True)
-    pa.parquet.write_table(
-        t,
-        f"{base_path}/{path}",
-        row_group_size=2 ** 40,
-        use_dictionary=use_dictionary,
-        compression=compression,
-        write_statistics=True,
-        data_page_size=data_page_size,
-        data_page_version=f"{page_version}.0",
+    # pa.OSFile keeps the incremental page writes inside Arrow's C++ IO
+    # layer rather than bouncing through a Python file object per page
+    with pa.OSFile(full_path, "wb") as sink:
+        pa.parquet.write_table(
+            table,
+            sink,
+            row_group_size=2 ** 40,
+            use_dictionary=use_dictionary,
+            compression=compression,
+            # statistics are recomputed for every variant of the same data;
+            # that is redundant, but the read tests assert on min/max/null
+            # counts and pyarrow has no API to attach precomputed statistics,
+            # so this scan cannot be shared across the variants from Python
+            write_statistics=True,
+            data_page_size=data_page_size,
+            data_page_version=f"{page_version}.0",
+            # the pinned pyarrow (6, see .github/workflows) always writes
+            # decimals as FIXED_LEN_BYTE_ARRAY; store_decimal_as_integer
+            # (pyarrow >= 16) would emit the narrower INT32/INT64 physical
+            # types for decimal_9/decimal_18 once the pin moves.
+            # bloom filters are never written by the pinned pyarrow (they
+            # are opt-in from the versions that support them at all), which
+            # is what these fixtures want: no consumer asserts on them, so
+            # the per-column hashing pass and bloom pages stay skipped
+        )
+
+
+# the fixture sweep is fully deterministic: resolve the settings
+# combinations once at import so dispatch is a flat loop
+_FIXTURE_CASES = [
+    case_basic_nullable,
+    case_basic_required,
+    case_nested,
+    case_struct,
+    case_nested_edge,
+]
+# the codec set is pinned by the consumers: "lz4" here means the legacy
+# LZ4 parquet codec, which is the only LZ4 flavour parquet2 decodes (it
+# has no LZ4_RAW support), and tests/it/io/parquet hardcodes these codec
+# directory names. The faster-to-encode lz4_raw cannot be used until
+# parquet2 learns to read it.
+_FIXTURE_SETTINGS = [
+    (version, use_dict, compression)
+    for version in [1, 2]
+    for use_dict in [True, False]
+    for compression in ["lz4", None, "snappy"]
+]
+
+
+def write_fixtures():
+    # the table is independent of the write settings: build it once per case
+    for case in _FIXTURE_CASES:
+        data, schema, path = case()
+        table = pa.table(data, schema=schema)
+        for version, use_dict, compression in _FIXTURE_SETTINGS:
+            write_pyarrow_table(
+                table,
+                _full_path(path, version, use_dict, False, compression),
+                version,
+                use_dict,
+                False,
+                compression,
+            )
+
+
+def _tile_indices(size):
+    # [0..8) repeated size // 8 times; a single C-level np.tile instead of
+    # a Python list of `size` PyObject pointers
+    return pa.array(np.tile(np.arange(8, dtype=np.int64), size // 8))
+
+
+def _tile_bool(values, size):
+    # replicate straight into packed bitmaps: np.packbits emits one bit per
+    # value with no per-element dispatch, and the validity buffer is only
+    # materialized when the base actually has nulls
+    reps = size // 8
+    base = values.slice(0, 8)
+    bits = np.packbits(
+        np.tile(base.fill_null(False).to_numpy(zero_copy_only=False), reps),
+        bitorder="little",
+    )
+    buffers = [None, pa.py_buffer(bits)]
+    if base.null_count:
+        validity = np.packbits(
+            np.tile(~base.is_null().to_numpy(zero_copy_only=False), reps),
+            bitorder="little",
+        )
+        buffers[0] = pa.py_buffer(validity)
+    return pa.Array.from_buffers(pa.bool_(), size, buffers)
+
+
+def _tile_utf8_constant(values, size):
+    # a single distinct string: encode and validate its UTF-8 once, then
+    # assemble the column from an arange offsets buffer and a memcpy-tiled
+    # data buffer instead of re-encoding the value per element
+    data = values[0].as_py().encode("utf-8")
+    offsets = np.arange(size + 1, dtype=np.int32) * len(data)
+    tiled = np.tile(np.frombuffer(data, dtype=np.uint8), size)
+    return pa.Array.from_buffers(
+        pa.utf8(), size, [None, pa.py_buffer(offsets), pa.py_buffer(tiled)]
     )
 
 
-for case in [case_basic_nullable, case_basic_required, case_nested, case_struct, case_nested_edge]:
-    for version in [1, 2]:
-        for use_dict in [True, False]:
-            for compression in ["lz4", None, "snappy"]:
-                write_pyarrow(case(), version, use_dict, False, compression)
+def _tile(values, indices):
+    if values.type == pa.bool_():
+        return _tile_bool(values, len(indices))
+    if (
+        values.type == pa.utf8()
+        and values.null_count == 0
+        and len(values.unique()) == 1
+    ):
+        return _tile_utf8_constant(values, len(indices))
+    return values.take(indices)
+
+
+def _bench_base(case):
+    data, schema, _ = case()
+    return {
+        k: (
+            v if isinstance(v, pa.Array) else pa.array(v, type=schema.field(k).type)
+        ).slice(0, 8)
+        for k, v in data.items()
+    }
+
+
+# the 8-row replication bases are constants: materialize them as Arrow
+# arrays once at import so the bench cases reduce to tiling
+_BENCHES_BASE = _bench_base(case_basic_nullable)
+_BENCHES_REQUIRED_BASE = _bench_base(case_basic_required)
 
 
 def case_benches(size):
     assert size % 8 == 0
-    data, schema, _ = case_basic_nullable()
-    for k in data:
-        data[k] = data[k][:8] * (size // 8)
-    return data, schema, f"benches_{size}.parquet"
+    indices = _tile_indices(size)
+    data = {k: _tile(v, indices) for k, v in _BENCHES_BASE.items()}
+    return data, _SCHEMA_BASIC_NULLABLE, f"benches_{size}.parquet"
 
 
 def case_benches_required(size):
     assert size % 8 == 0
-    data, schema, _ = case_basic_required()
-    for k in data:
-        data[k] = data[k][:8] * (size // 8)
-    return data, schema, f"benches_required_{size}.parquet"
-
-
-# for read benchmarks
-for i in range(10, 22, 2):
-    # two pages (dict)
-    write_pyarrow(case_benches(2 ** i), 1, True, False, None)
-    # single page
-    write_pyarrow(case_benches(2 ** i), 1, False, False, None)
+    indices = _tile_indices(size)
+    data = {k: _tile(v, indices) for k, v in _BENCHES_REQUIRED_BASE.items()}
+    return data, _SCHEMA_BASIC_REQUIRED, f"benches_required_{size}.parquet"
+
+
+# writer-settings sweep for the nullable bench case. The Arrow data (and
+# with it the input to the writer's definition/repetition level pass) is
+# shared across all variants; only dictionary encoding, page size and
+# compression differ. pyarrow exposes no way to reuse the encoded pages
+# themselves across output files, so each variant re-encodes from the
+# shared buffers. The dictionary-build phase only runs for the first one.
+_BENCH_VARIANTS = [
+    # (use_dictionary, multiple_pages, compression)
+    (True, False, None),  # two pages (dict)
+    (False, False, None),  # single page
+    (False, True, None),  # multiple pages
+    (False, True, "snappy"),  # multiple compressed pages
+    (False, False, "snappy"),  # single compressed page
+]
+
+
+def _write_benches_size(size):
+    # materialize each million-row case once; Arrow buffers are immutable,
+    # so the variants below encode the same data without rebuilding it
+    data, schema, path = case_benches(size)
+    table = pa.table(data, schema=schema)
+    for use_dictionary, multiple_pages, compression in _BENCH_VARIANTS:
+        write_pyarrow_table(
+            table,
+            _full_path(path, 1, use_dictionary, multiple_pages, compression),
+            1,
+            use_dictionary,
+            multiple_pages,
+            compression,
+        )
     # single page required
-    write_pyarrow(case_benches_required(2 ** i), 1, False, False, None)
-    # multiple pages
-    write_pyarrow(case_benches(2 ** i), 1, False, True, None)
-    # multiple compressed pages
-    write_pyarrow(case_benches(2 ** i), 1, False, True, "snappy")
-    # single compressed page
-    write_pyarrow(case_benches(2 ** i), 1, False, False, "snappy")
+    data, schema, path = case_benches_required(size)
+    write_pyarrow_table(
+        pa.table(data, schema=schema),
+        _full_path(path, 1, False, False, None),
+        1,
+        False,
+        False,
+        None,
+    )
+
+
+def write_benches():
+    # for read benchmarks; sizes are independent, so spread the CPU-bound
+    # encoding over processes (threads would serialize on the GIL during
+    # the Python->Arrow conversion)
+    sizes = [2 ** i for i in range(10, 22, 2)]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_write_benches_size, sizes))
+
+
+if __name__ == "__main__":
+    write_fixtures()
+    write_benches()
+    # only stamp after a complete run; an aborted run stays stale and is
+    # fully rewritten next time (workers re-read the old stamp meanwhile)
+    with open(_STAMP_PATH, "w") as stamp:
+        stamp.write(GENERATOR_VERSION)